@@ -8,7 +8,7 @@ from urllib.parse import parse_qs, urlencode, urlparse
 import requests
 
 from health import check_api_health
-from utils import FyersConfig, compute_backoff, sleep_with_log
+from utils import FyersConfig, compute_backoff, http_session, sleep_with_log
 
 
 class FyersAuthManager:
@@ -53,7 +53,7 @@ class FyersAuthManager:
 
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                response = requests.post(token_url, json=payload, timeout=self.config.timeout_seconds)
+                response = http_session.post(token_url, json=payload, timeout=self.config.timeout_seconds)
                 if response.status_code in (429, 502, 503):
                     delay = compute_backoff(self.config.backoff_base, attempt)
                     sleep_with_log(
@@ -104,7 +104,7 @@ class FyersAuthManager:
 
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                response = requests.get(profile_url, headers=headers, timeout=self.config.timeout_seconds)
+                response = http_session.get(profile_url, headers=headers, timeout=self.config.timeout_seconds)
                 if response.status_code == 200:
                     return True
                 if response.status_code in (429, 502, 503):
@@ -5,7 +5,7 @@ from typing import Optional
 
 import requests
 
-from utils import FyersConfig
+from utils import FyersConfig, http_session
 
 
 @dataclass
@@ -46,7 +46,7 @@ class CircuitBreaker:
 def check_api_health(config: FyersConfig, logger: logging.Logger) -> HealthStatus:
     url = config.base_url
     try:
-        response = requests.get(url, timeout=config.timeout_seconds)
+        response = http_session.get(url, timeout=config.timeout_seconds)
         if response.status_code == 503:
             logger.error(
                 "Fyers API unhealthy - service unavailable",
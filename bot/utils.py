@@ -8,9 +8,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
+import requests
 from dotenv import load_dotenv
 
 
+# Shared keep-alive session: the health check, token exchange and token
+# validation all hit the same host, so only the first call pays the TLS handshake.
+http_session = requests.Session()
+
+
 @dataclass
 class FyersConfig:
     client_id: str
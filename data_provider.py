@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import List
+from typing import Dict, List, Tuple
 
 from execution.fyers_adapter import FyersAdapter
 
@@ -9,6 +9,8 @@ from execution.fyers_adapter import FyersAdapter
 class DataProvider:
     def __init__(self, fyers_adapter: FyersAdapter):
         self.fyers = fyers_adapter
+        # (symbol, timeframe) -> epoch before which an empty delta is not re-asked.
+        self._empty_result_until: Dict[Tuple[str, str], float] = {}
 
     def get_latest_data(self, symbol: str, timeframe: str = "5") -> List[List[float]]:
         """
@@ -19,14 +21,43 @@ class DataProvider:
         to_date = int(time.time())
         from_date = to_date - (5 * 24 * 60 * 60)
 
-        candles = self.fyers.get_history(
-            symbol=symbol,
-            resolution=timeframe,
-            range_from=str(from_date),
-            range_to=str(to_date),
-        )
+        candles = self._history(symbol, timeframe, from_date, to_date)
 
         if not candles:
             raise ValueError(f"No data received for {symbol}")
 
         return candles
+
+    def fetch_history(self, symbol: str, timeframe: str = "5", bars: int = 200) -> List[List[float]]:
+        """
+        Bootstrap window: the last `bars` candles, fetched once at startup.
+        """
+        return self.get_latest_data(symbol, timeframe)[-bars:]
+
+    def fetch_since(self, symbol: str, timeframe: str, last_ts: float) -> List[List[float]]:
+        """
+        Delta fetch: candles from `last_ts` (inclusive) to now, so the
+        still-forming last bar comes back with its updated values.
+        May be empty when the broker has nothing newer; an empty answer is
+        remembered until the next bar boundary instead of re-fetched every poll.
+        """
+        key = (symbol, timeframe)
+        now = time.time()
+        if now < self._empty_result_until.get(key, 0.0):
+            return []
+
+        candles = self._history(symbol, timeframe, int(last_ts), int(now))
+        if candles:
+            self._empty_result_until.pop(key, None)
+        elif timeframe.isdigit():
+            bar_seconds = int(timeframe) * 60
+            self._empty_result_until[key] = (now // bar_seconds + 1) * bar_seconds
+        return candles
+
+    def _history(self, symbol: str, timeframe: str, from_date: int, to_date: int) -> List[List[float]]:
+        return self.fyers.get_history(
+            symbol=symbol,
+            resolution=timeframe,
+            range_from=str(from_date),
+            range_to=str(to_date),
+        )
@@ -43,11 +43,13 @@ class RiskManager:
             self._last_reset_day = today
 
     def calculate_position_size(self, entry_price: float, stop_loss: float) -> int:
-        risk_per_unit = abs(entry_price - stop_loss)
+        # Whole paise and floor division: a 100.0 entry with a 99.6 stop risking
+        # 1000 must size 2500, not the 2499 a float quotient truncates to.
+        risk_per_unit = round(abs(entry_price - stop_loss) * 100)
         if risk_per_unit <= 0:
             return 0
-        risk_amount = self.capital * self.risk_per_trade
-        return max(int(risk_amount / risk_per_unit), 0)
+        risk_amount = round(self.capital * self.risk_per_trade * 100)
+        return max(risk_amount // risk_per_unit, 0)
 
     def can_open_new_trade(self, now: datetime) -> RiskSnapshot:
         with self._lock:
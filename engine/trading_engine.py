@@ -282,6 +282,9 @@ class TradingEngine:
         }
 
     def _log_event(self, event: str, details: Dict[str, Any]) -> None:
+        # Skip building and serialising the payload when INFO is filtered out.
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         payload = {
             "timestamp": datetime.now().isoformat(),
             "event": event,
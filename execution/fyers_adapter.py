@@ -1,19 +1,58 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import hashlib
 import hmac
 import json
 import logging
 import os
+import random
+import re
 import struct
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote_plus, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+# Environment and callback URLs repeat for the life of the process.
+_parse_abs = functools.lru_cache(maxsize=32)(urlparse)
+
+# Query-string lookups for the OAuth callback; one match instead of a
+# full parse_qs dict.
+_AUTH_CODE_RE = re.compile(r"[?&]auth_code=([^&#]+)")
+_CODE_RE = re.compile(r"[?&]code=([^&#]+)")
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+# O_CLOEXEC keeps the descriptor out of any child processes; absent on Windows.
+_TOKEN_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+class TokenExpiredError(requests.HTTPError):
+    """The broker rejected the current access token (401/403); re-authenticate."""
 
 
 class FyersAdapter:
@@ -27,64 +66,160 @@ class FyersAdapter:
     - Auth cooldown protection
     """
 
+    # (field, check, error) applied in order by _validate_order. `type(v) is
+    # int` rather than isinstance, so True/False never pass as 1/0.
+    _ORDER_CHECKS = (
+        ("symbol", lambda v: isinstance(v, str) and bool(v.strip()), "Order symbol must be a non-empty string"),
+        ("qty", lambda v: type(v) is int and v > 0, "Order qty must be a positive integer"),
+        ("productType", lambda v: v == "INTRADAY", "Order productType must be INTRADAY"),
+        ("side", lambda v: type(v) is int and v in (1, -1), "Order side must be 1 (buy) or -1 (sell)"),
+        ("type", lambda v: type(v) is int and v in (1, 2, 3, 4), "Order type must be one of 1, 2, 3, 4"),
+    )
+    _ORDER_DEDUPE_MAX = 10000
+    # Symbols per /data/quotes request; keeps the comma-joined URL short.
+    _QUOTES_BATCH_SIZE = 50
+    # Auth must stay reachable to recover, so these never trip or honour the breaker.
+    _CIRCUIT_EXEMPT_PATHS = frozenset({"/api/v3/token", "/api/v3/profile"})
+    # Per-call override that drops the session Authorization header (None
+    # removes it) for login calls that must not carry the trading token.
+    _NO_AUTH = {"Authorization": None}
+
     def __init__(self):
         self.logger = logging.getLogger("fyers_adapter")
 
         # ----------------------------
         # Environment
         # ----------------------------
-        self.client_id = os.getenv("FYERS_CLIENT_ID", "").strip()
-        self.secret_key = os.getenv("FYERS_SECRET_KEY", "").strip()
-        self.redirect_uri = os.getenv("FYERS_REDIRECT_URI", "").strip()
-        self.base_url = os.getenv("FYERS_BASE_URL", "").strip()
-        self.fyers_user_id = os.getenv("FYERS_USER_ID", "").strip()
-        self.fyers_pin = os.getenv("FYERS_PIN", "").strip()
-        self.fyers_totp_secret = os.getenv("FYERS_TOTP_SECRET", "").strip()
-        self.enable_auto_auth = os.getenv("FYERS_AUTO_AUTH", "false").strip().lower() == "true"
-
-        if not self.client_id:
-            raise RuntimeError("FYERS_CLIENT_ID not set")
-        if not self.secret_key:
-            raise RuntimeError("FYERS_SECRET_KEY not set")
-        if not self.redirect_uri:
-            raise RuntimeError("FYERS_REDIRECT_URI not set")
-        if not self.base_url:
-            raise RuntimeError("FYERS_BASE_URL not set")
+        env = os.environ
+        self.client_id = env.get("FYERS_CLIENT_ID", "").strip()
+        self.secret_key = env.get("FYERS_SECRET_KEY", "").strip()
+        self.redirect_uri = env.get("FYERS_REDIRECT_URI", "").strip()
+        self.base_url = env.get("FYERS_BASE_URL", "").strip()
+        self.fyers_user_id = env.get("FYERS_USER_ID", "").strip()
+        self.fyers_pin = env.get("FYERS_PIN", "").strip()
+        self.fyers_totp_secret = env.get("FYERS_TOTP_SECRET", "").strip()
+        self.enable_auto_auth = env.get("FYERS_AUTO_AUTH", "false").strip().lower() == "true"
+
+        self._validate_env()
+
+        # Credentials are fixed for the process lifetime; hash them once.
+        self._cached_app_id_hash = hashlib.sha256(
+            f"{self.client_id}:{self.secret_key}".encode("utf-8")
+        ).hexdigest()
+
+        # Full URLs for the fixed REST paths, built once instead of per request.
+        self._urls: Dict[str, str] = {
+            path: f"{self.base_url}{path}"
+            for path in (
+                "/api/v3/profile",
+                "/api/v3/token",
+                "/api/v3/orders",
+                "/api/v3/positions",
+                "/data/quotes",
+                "/data/history",
+            )
+        }
 
-        # No fallback to api-t1 allowed
-        if "api-t1" in self.base_url:
-            self.logger.warning("Using TEST environment (api-t1). Ensure this is intentional.")
+        # Everything but the state is fixed, so encode it once.
+        self._login_url_template = (
+            f"{self.base_url}/api/v3/generate-authcode"
+            f"?client_id={quote(self.client_id, safe='')}"
+            f"&redirect_uri={quote(self.redirect_uri, safe='')}"
+            "&response_type=code"
+            "&state="
+        )
 
-        token_path = os.getenv("FYERS_TOKEN_FILE", ".secrets/fyers_token.json")
+        token_path = env.get("FYERS_TOKEN_FILE", ".secrets/fyers_token.json")
         self.token_file = Path(token_path)
+        self.token_file.parent.mkdir(parents=True, exist_ok=True)
 
         self.session = requests.Session()
+        # Size the pool for concurrent quote/order/validation calls so bursts
+        # reuse warm keep-alive connections instead of dialling new TLS sessions.
+        self._pool_maxsize = int(env.get("FYERS_POOL_MAXSIZE", "64"))
+        http_adapter = HTTPAdapter(
+            pool_connections=int(env.get("FYERS_POOL_CONNECTIONS", "4")),
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False,
+        )
+        self.session.mount("https://", http_adapter)
+        self.session.mount("http://", http_adapter)
+        # Auth lives on the session itself so call sites pass no headers=
+        # and requests has nothing to merge per call.
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+        })
+        # Caps in-flight async requests at the pool size; created per event loop.
+        self._async_gate: Optional[asyncio.Semaphore] = None
+        self._async_gate_loop: Optional[asyncio.AbstractEventLoop] = None
         self.access_token = ""
 
         # ----------------------------
         # Retry Settings
         # ----------------------------
-        self._max_retries = int(os.getenv("FYERS_MAX_RETRIES", "5"))
-        self._base_backoff = float(os.getenv("FYERS_BACKOFF_BASE", "0.5"))
+        self._max_retries = int(env.get("FYERS_MAX_RETRIES", "5"))
+        self._base_backoff = float(env.get("FYERS_BACKOFF_BASE", "0.5"))
+        self._max_backoff = float(env.get("FYERS_BACKOFF_MAX", "30"))
+        self._rng = random.Random(os.urandom(8))
+
+        # ----------------------------
+        # Circuit Breaker
+        # ----------------------------
+        self._circuit_threshold = int(env.get("FYERS_CIRCUIT_THRESHOLD", "5"))
+        self._circuit_cooldown_seconds = float(env.get("FYERS_CIRCUIT_COOLDOWN_SECONDS", "30"))
+        self._consecutive_5xx = 0
+        self._circuit_open_until = float("-inf")
 
         # ----------------------------
         # Auth Cooldown
         # ----------------------------
         self._auth_lock = threading.Lock()
         self._token_validation_lock = threading.Lock()
-        self._token_validation_ttl_seconds = int(os.getenv("FYERS_TOKEN_VALIDATION_TTL_SECONDS", "15"))
-        self._last_token_validation_ts = 0.0
-        self._last_token_validation_result = False
-        self._auth_fail_lock = threading.Lock()
+        self._token_validation_ttl_seconds = int(env.get("FYERS_TOKEN_VALIDATION_TTL_SECONDS", "15"))
+        # (monotonic ts, result), always replaced whole so the lock-free read
+        # in validate_token never pairs one probe's time with another's result.
+        self._token_validation: Tuple[float, bool] = (float("-inf"), False)
         self._last_auth_failure_ts = 0.0
         self._auth_failure_cooldown_seconds = int(
-            os.getenv("FYERS_AUTH_FAILURE_COOLDOWN_SECONDS", "60")
+            env.get("FYERS_AUTH_FAILURE_COOLDOWN_SECONDS", "60")
         )
 
+        # ----------------------------
+        # In-flight GETs
+        # ----------------------------
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # ----------------------------
+        # Fan-out Pool
+        # ----------------------------
+        # Created on first multi-batch call; capped by the HTTP pool size so
+        # workers never queue on pool_block or open throwaway connections.
+        self._concurrency = min(int(env.get("FYERS_CONCURRENCY", "16")), self._pool_maxsize)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # ----------------------------
+        # Response Cache
+        # ----------------------------
+        # Strategies poll the same quote/positions within one decision tick.
+        self._ltp_cache_ttl = float(env.get("FYERS_LTP_CACHE_MS", "500")) / 1000
+        self._positions_cache_ttl = float(env.get("FYERS_POSITIONS_CACHE_MS", "1000")) / 1000
+        self._ltp_cache: Dict[str, Tuple[float, float]] = {}
+        self._positions_cache: Tuple[float, List[Dict]] = (float("-inf"), [])
+        # Bumped by every order attempt; a positions fetch only caches its
+        # answer if no order went in while it was in flight.
+        self._positions_generation = 0
+        self._positions_lock = threading.Lock()
+
         # ----------------------------
         # Order Dedupe
         # ----------------------------
-        self._order_dedupe = set()
+        # Key -> expiry. One TTL for every key keeps insertion order equal to
+        # expiry order, so expired keys are always at the front.
+        self._order_dedupe_ttl = float(env.get("FYERS_ORDER_DEDUPE_TTL_SECONDS", "2"))
+        self._order_dedupe: "OrderedDict[Tuple[Any, ...], float]" = OrderedDict()
         self._order_dedupe_lock = threading.Lock()
 
         # ----------------------------
@@ -96,74 +231,251 @@ class FyersAdapter:
 
         self._load_token()
 
+    def _validate_env(self) -> None:
+        # Runs once from __init__; request paths never re-check the environment.
+        if not self.client_id:
+            raise RuntimeError("FYERS_CLIENT_ID not set")
+        if not self.secret_key:
+            raise RuntimeError("FYERS_SECRET_KEY not set")
+        if not self.redirect_uri:
+            raise RuntimeError("FYERS_REDIRECT_URI not set")
+        if not self.base_url:
+            raise RuntimeError("FYERS_BASE_URL not set")
+
+        for name, value in (("FYERS_BASE_URL", self.base_url), ("FYERS_REDIRECT_URI", self.redirect_uri)):
+            parsed = _parse_abs(value)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc:
+                raise RuntimeError(f"{name} must be an absolute http(s) URL")
+
+        # No fallback to api-t1 allowed
+        if "api-t1" in self.base_url:
+            self.logger.warning("Using TEST environment (api-t1). Ensure this is intentional.")
+
     # ============================================================
     # AUTH HEADERS
     # ============================================================
 
-    def _headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"{self.client_id}:{self.access_token}",
-            "Content-Type": "application/json",
-        }
+    @property
+    def access_token(self) -> str:
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        # Every token change reinstalls the session Authorization header.
+        self._access_token = value
+        self._install_session_headers()
+
+    def _install_session_headers(self) -> None:
+        self.session.headers["Authorization"] = f"{self.client_id}:{self._access_token}"
 
     # ============================================================
     # HTTP WITH BACKOFF
     # ============================================================
 
-    def _request_with_backoff(self, method: str, path: str, **kwargs) -> requests.Response:
-        url = f"{self.base_url}{path}"
-        last_exc = None
+    def _request_with_backoff(
+        self, method: str, path: str, flight_tag: Any = None, **kwargs
+    ) -> requests.Response:
+        # A streamed body can only be read once, so it is never shared.
+        if method != "GET" or kwargs.get("stream"):
+            return self._send_with_backoff(method, path, **kwargs)
+
+        # Singleflight: concurrent identical GETs share one upstream call.
+        # `flight_tag` keeps callers from joining a call whose answer they
+        # must not see (e.g. positions fetched before an order went in).
+        key = f"{path}|{flight_tag}|{sorted(kwargs.items())}"
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            resp = self._send_with_backoff(method, path, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _send_with_backoff(self, method: str, path: str, **kwargs) -> requests.Response:
+        self._check_circuit(method, path)
+        url = self._urls.get(path) or f"{self.base_url}{path}"
+        # Bound once per call rather than looked up on every attempt.
+        send = self.session.request
+        retry_backoff = self._retry_backoff
 
         for attempt in range(self._max_retries + 1):
             try:
-                resp = self.session.request(method, url, timeout=15, **kwargs)
-
-                if resp.status_code in (429, 500, 502, 503, 504):
-                    if attempt >= self._max_retries:
-                        resp.raise_for_status()
-                    backoff = self._base_backoff * (2 ** attempt)
-                    self.logger.warning(
-                        "retryable_status method=%s path=%s status=%s attempt=%s backoff=%.2f",
-                        method, path, resp.status_code, attempt + 1, backoff
-                    )
-                    time.sleep(backoff)
-                    continue
+                resp = send(method, url, timeout=15, **kwargs)
+            except requests.RequestException as exc:
+                backoff = retry_backoff(method, path, attempt, exc=exc)
+            else:
+                backoff = retry_backoff(method, path, attempt, resp=resp)
+                if backoff is None:
+                    return resp
+            time.sleep(backoff)
 
-                if resp.status_code >= 400:
-                    resp.raise_for_status()
+        raise RuntimeError(f"Unhandled request failure for {method} {path}")
 
-                return resp
+    async def _arequest_with_backoff(self, method: str, path: str, **kwargs) -> requests.Response:
+        # Same retry policy as _request_with_backoff, but backoff waits park the
+        # coroutine instead of a worker thread.
+        self._check_circuit(method, path)
+        url = self._urls.get(path) or f"{self.base_url}{path}"
+        send = self.session.request
+        retry_backoff = self._retry_backoff
 
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._async_semaphore():
+                    resp = await asyncio.to_thread(send, method, url, timeout=15, **kwargs)
             except requests.RequestException as exc:
-                last_exc = exc
-                status = getattr(getattr(exc, "response", None), "status_code", None)
+                backoff = retry_backoff(method, path, attempt, exc=exc)
+            else:
+                backoff = retry_backoff(method, path, attempt, resp=resp)
+                if backoff is None:
+                    return resp
+            await asyncio.sleep(backoff)
 
-                if status and 400 <= status < 500:
-                    break
+        raise RuntimeError(f"Unhandled request failure for {method} {path}")
 
-                if attempt >= self._max_retries:
-                    break
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._async_gate is None or self._async_gate_loop is not loop:
+            self._async_gate = asyncio.Semaphore(self._pool_maxsize)
+            self._async_gate_loop = loop
+        return self._async_gate
+
+    def _fan_out(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._concurrency,
+                        thread_name_prefix="fyers",
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        """Stop the fan-out pool and release pooled connections."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.session.close()
+
+    def _retry_backoff(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        resp: Optional[requests.Response] = None,
+        exc: Optional[requests.RequestException] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt.
+        Returns None when `resp` is final and raises once retrying is pointless.
+        """
+        if resp is not None:
+            status = resp.status_code
+        else:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+        self._record_upstream_health(path, healthy=status is not None and status < 500)
+
+        if resp is not None:
+            if resp.status_code in (429, 500, 502, 503, 504) and attempt < self._max_retries:
+                backoff = self._backoff_delay(attempt, resp)
+                self.logger.warning(
+                    "retryable_status method=%s path=%s status=%s attempt=%s backoff=%.2f",
+                    method, path, resp.status_code, attempt + 1, backoff
+                )
+                # Never returned to the caller: free a streamed connection now.
+                resp.close()
+                return backoff
+
+            if resp.status_code < 400:
+                return None
+            try:
+                resp.raise_for_status()
+            except requests.HTTPError as http_exc:
+                exc = http_exc
+                # Past here `resp` is only raised or retried, never returned.
+                resp.close()
+            else:
+                return None
+
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if status in (401, 403) and path != "/api/v3/token":
+            # React to rejection instead of probing /profile before every call.
+            self._invalidate_token_validation()
+            raise TokenExpiredError(
+                f"Access token rejected ({status}) for {method} {path}", response=exc.response
+            ) from exc
+        if (status and 400 <= status < 500) or attempt >= self._max_retries:
+            raise exc
+
+        return self._backoff_delay(attempt, getattr(exc, "response", None))
+
+    def _check_circuit(self, method: str, path: str) -> None:
+        if path in self._CIRCUIT_EXEMPT_PATHS:
+            return
+        if time.monotonic() < self._circuit_open_until:
+            raise RuntimeError(f"Circuit open for {method} {path}: upstream failing, retry later")
 
-                backoff = self._base_backoff * (2 ** attempt)
-                time.sleep(backoff)
+    def _record_upstream_health(self, path: str, healthy: bool) -> None:
+        if path in self._CIRCUIT_EXEMPT_PATHS:
+            return
+        if healthy:
+            self._consecutive_5xx = 0
+            return
+        self._consecutive_5xx += 1
+        if self._consecutive_5xx >= self._circuit_threshold:
+            self._circuit_open_until = time.monotonic() + self._circuit_cooldown_seconds
+            self._consecutive_5xx = 0
+            self.logger.error(
+                "circuit_open path=%s cooldown=%.0fs", path, self._circuit_cooldown_seconds
+            )
 
-        if last_exc:
-            raise last_exc
+    def _backoff_delay(self, attempt: int, resp: Optional[requests.Response]) -> float:
+        # Honour the server's Retry-After exactly when given. Otherwise use
+        # "full jitter" so threads throttled together do not retry in lockstep.
+        retry_after = None
+        if resp is not None:
+            retry_after = self._parse_retry_after(getattr(resp, "headers", {}).get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self._max_backoff)
+        cap = min(self._base_backoff * (2 ** attempt), self._max_backoff)
+        return self._rng.uniform(0, cap)
 
-        raise RuntimeError(f"Unhandled request failure for {method} {path}")
+    @staticmethod
+    def _parse_retry_after(value: Any) -> Optional[float]:
+        if not isinstance(value, str) or not value.strip():
+            return None
+        value = value.strip()
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
     # ============================================================
     # OAUTH LOGIN
     # ============================================================
 
     def get_login_url(self, state: str = "manual_login") -> str:
-        return (
-            f"{self.base_url}/api/v3/generate-authcode"
-            f"?client_id={self.client_id}"
-            f"&redirect_uri={self.redirect_uri}"
-            "&response_type=code"
-            f"&state={state}"
-        )
+        return self._login_url_template + quote(state, safe="")
 
     def exchange_auth_code(self, auth_code: str) -> Dict[str, Any]:
         if not auth_code:
@@ -184,14 +496,19 @@ class FyersAdapter:
         last_error: Optional[Exception] = None
         for payload in payload_attempts:
             try:
-                resp = self._request_with_backoff("POST", "/api/v3/token", json=payload)
-                data = resp.json()
+                resp = self._request_with_backoff(
+                    "POST", "/api/v3/token",
+                    data=_json_dumps(payload),
+                    headers=self._NO_AUTH,
+                )
+                data = _json_loads(resp.content)
 
                 token = data.get("access_token")
                 if not token:
                     raise RuntimeError(f"OAuth exchange failed: {data}")
 
                 self.access_token = token
+                self._invalidate_token_validation()
                 self._save_token(token)
                 self.validate_token(force=True)
                 return data
@@ -265,33 +582,81 @@ class FyersAdapter:
         if not self.access_token:
             return False
 
+        # Lock-free fast path for the common "recently validated" case.
+        if not force:
+            checked_at, valid = self._token_validation
+            if valid and (time.monotonic() - checked_at) < self._token_validation_ttl_seconds:
+                return True
+
         with self._token_validation_lock:
-            now = time.time()
-            if not force and (now - self._last_token_validation_ts) < self._token_validation_ttl_seconds:
-                return self._last_token_validation_result
+            now = time.monotonic()
+            checked_at, valid = self._token_validation
+            if not force and (now - checked_at) < self._token_validation_ttl_seconds:
+                return valid
 
             try:
-                resp = self._request_with_backoff("GET", "/api/v3/profile", headers=self._headers())
+                # Only the status matters: stream so the profile body is never read.
+                resp = self._request_with_backoff("GET", "/api/v3/profile", stream=True)
                 valid = resp.status_code == 200
+                resp.close()
             except Exception:
                 valid = False
 
-            self._last_token_validation_ts = now
-            self._last_token_validation_result = valid
+            self._token_validation = (now, valid)
             return valid
 
+    def _invalidate_token_validation(self) -> None:
+        # A new token must be probed again rather than inherit the old result.
+        self._token_validation = (float("-inf"), False)
+
     # ============================================================
     # MARKET DATA
     # ============================================================
 
     def get_ltp(self, symbol: str) -> float:
+        return self._pick_ltp(symbol, self.get_ltps([symbol]))
+
+    async def get_ltp_async(self, symbol: str) -> float:
+        return self._pick_ltp(symbol, await self.get_ltps_async([symbol]))
+
+    def get_ltps(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        LTPs for several symbols, one /data/quotes call per batch of
+        _QUOTES_BATCH_SIZE symbols to keep the query string bounded.
+        Symbols still fresh in the LTP cache are not requested again.
+        """
+        ltps, missing = self._split_cached_ltps(symbols)
+        batches = self._quote_batches(missing)
+        if len(batches) == 1:
+            ltps.update(self._fetch_ltps(batches[0]))
+        elif batches:
+            # Batches are independent idempotent GETs: issue them in parallel.
+            for batch_ltps in self._fan_out().map(self._fetch_ltps, batches):
+                ltps.update(batch_ltps)
+        return ltps
+
+    def _fetch_ltps(self, batch: List[str]) -> Dict[str, float]:
         resp = self._request_with_backoff(
             "GET", "/data/quotes",
-            params={"symbols": symbol},
-            headers=self._headers(),
+            params={"symbols": ",".join(batch)},
+        )
+        return self._store_ltps(batch, resp)
+
+    async def get_ltps_async(self, symbols: List[str]) -> Dict[str, float]:
+        ltps, missing = self._split_cached_ltps(symbols)
+        results = await asyncio.gather(
+            *(self._fetch_ltps_async(batch) for batch in self._quote_batches(missing))
+        )
+        for batch_ltps in results:
+            ltps.update(batch_ltps)
+        return ltps
+
+    async def _fetch_ltps_async(self, batch: List[str]) -> Dict[str, float]:
+        resp = await self._arequest_with_backoff(
+            "GET", "/data/quotes",
+            params={"symbols": ",".join(batch)},
         )
-        data = resp.json()
-        return float(data.get("d", [{}])[0].get("v", {}).get("lp"))
+        return self._store_ltps(batch, resp)
 
     def get_history(self, symbol: str, resolution: str = "5",
                     range_from: str = "1704067200",
@@ -307,82 +672,200 @@ class FyersAdapter:
                 "range_to": range_to,
                 "cont_flag": "1",
             },
-            headers=self._headers(),
         )
-        return resp.json().get("candles", [])
+        return _json_loads(resp.content).get("candles", [])
 
     # ============================================================
     # ORDERS
     # ============================================================
 
     def place_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        key = f"{order.get('symbol')}|{order.get('side')}|{order.get('qty')}"
-        with self._order_dedupe_lock:
-            if key in self._order_dedupe:
-                raise ValueError("Duplicate order blocked")
-            self._order_dedupe.add(key)
-
+        self._validate_order(order)
+        key = self._claim_order(order)
         try:
             resp = self._request_with_backoff(
                 "POST", "/api/v3/orders",
-                json=order,
-                headers=self._headers(),
+                data=_json_dumps(order),
+            )
+            return _json_loads(resp.content)
+        except Exception:
+            # A failed submit may be retried at once; a placed one stays
+            # claimed until its TTL runs out.
+            self._release_order(key)
+            raise
+        finally:
+            self._positions_changed()
+
+    async def place_order_async(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_order(order)
+        key = self._claim_order(order)
+        try:
+            resp = await self._arequest_with_backoff(
+                "POST", "/api/v3/orders",
+                data=_json_dumps(order),
             )
-            return resp.json()
+            return _json_loads(resp.content)
+        except Exception:
+            # A failed submit may be retried at once; a placed one stays
+            # claimed until its TTL runs out.
+            self._release_order(key)
+            raise
         finally:
-            with self._order_dedupe_lock:
-                self._order_dedupe.discard(key)
+            self._positions_changed()
 
     def get_positions(self) -> List[Dict]:
-        resp = self._request_with_backoff(
-            "GET", "/api/v3/positions",
-            headers=self._headers(),
-        )
-        return resp.json().get("netPositions", [])
+        cached = self._cached_positions()
+        if cached is not None:
+            return cached
+        generation = self._positions_generation
+        resp = self._request_with_backoff("GET", "/api/v3/positions", flight_tag=generation)
+        return self._store_positions(resp, generation)
+
+    async def get_positions_async(self) -> List[Dict]:
+        cached = self._cached_positions()
+        if cached is not None:
+            return cached
+        generation = self._positions_generation
+        resp = await self._arequest_with_backoff("GET", "/api/v3/positions")
+        return self._store_positions(resp, generation)
 
     # ============================================================
     # UTILITIES
     # ============================================================
 
+    def _split_cached_ltps(self, symbols: List[str]) -> Tuple[Dict[str, float], List[str]]:
+        now = time.monotonic()
+        ltps: Dict[str, float] = {}
+        missing: List[str] = []
+        for symbol in symbols:
+            ts, value = self._ltp_cache.get(symbol, (float("-inf"), 0.0))
+            if now - ts < self._ltp_cache_ttl:
+                ltps[symbol] = value
+            else:
+                missing.append(symbol)
+        return ltps, missing
+
+    def _quote_batches(self, symbols: List[str]) -> List[List[str]]:
+        size = self._QUOTES_BATCH_SIZE
+        return [symbols[i:i + size] for i in range(0, len(symbols), size)]
+
+    def _store_ltps(self, symbols: List[str], resp: requests.Response) -> Dict[str, float]:
+        now = time.monotonic()
+        ltps: Dict[str, float] = {}
+        for entry in _json_loads(resp.content).get("d", []):
+            values = entry.get("v", {})
+            symbol = entry.get("n") or values.get("symbol")
+            if not symbol and len(symbols) == 1:
+                symbol = symbols[0]
+            if not symbol or values.get("lp") is None:
+                continue
+            ltp = float(values["lp"])
+            ltps[symbol] = ltp
+            self._ltp_cache[symbol] = (now, ltp)
+        return ltps
+
+    @staticmethod
+    def _pick_ltp(symbol: str, ltps: Dict[str, float]) -> float:
+        if symbol not in ltps:
+            raise RuntimeError(f"No LTP returned for {symbol}")
+        return ltps[symbol]
+
+    def _cached_positions(self) -> Optional[List[Dict]]:
+        ts, positions = self._positions_cache
+        if time.monotonic() - ts >= self._positions_cache_ttl:
+            return None
+        # Fresh dicts per caller: mutating a result never reaches the cache.
+        return [dict(p) for p in positions]
+
+    def _store_positions(self, resp: requests.Response, generation: int) -> List[Dict]:
+        positions = _json_loads(resp.content).get("netPositions", [])
+        # An order attempted mid-flight makes this snapshot stale: hand it to
+        # this caller only, never to the cache.
+        with self._positions_lock:
+            if generation == self._positions_generation:
+                self._positions_cache = (time.monotonic(), positions)
+        return [dict(p) for p in positions]
+
+    def _positions_changed(self) -> None:
+        # Any order attempt may have changed positions: drop the cache and
+        # retire every positions fetch already in flight.
+        with self._positions_lock:
+            self._positions_generation += 1
+            self._positions_cache = (float("-inf"), [])
+
+    def _validate_order(self, order: Dict[str, Any]) -> None:
+        # Reject malformed payloads before they cost a broker round trip.
+        get = order.get
+        for field, check, error in self._ORDER_CHECKS:
+            if not check(get(field)):
+                raise ValueError(error)
+
+    def _claim_order(self, order: Dict[str, Any]) -> Tuple[Any, ...]:
+        get = order.get
+        key = (get("symbol"), get("side"), get("qty"), get("type"))
+        dedupe = self._order_dedupe
+        # Check and claim under one lock so racing submits never both pass.
+        with self._order_dedupe_lock:
+            now = time.monotonic()
+            while dedupe and next(iter(dedupe.values())) <= now:
+                dedupe.popitem(last=False)
+            if key in dedupe:
+                raise ValueError("Duplicate order blocked")
+            dedupe[key] = now + self._order_dedupe_ttl
+            # Hard cap on top of the TTL: the oldest keys go first.
+            if len(dedupe) > self._ORDER_DEDUPE_MAX:
+                dedupe.popitem(last=False)
+        return key
+
+    def _release_order(self, key: Tuple[Any, ...]) -> None:
+        with self._order_dedupe_lock:
+            self._order_dedupe.pop(key, None)
+
     def _app_id_hash(self) -> str:
-        raw = f"{self.client_id}:{self.secret_key}"
-        return hashlib.sha256(raw.encode()).hexdigest()
+        return self._cached_app_id_hash
 
     def _save_token(self, token: str) -> None:
-        self.token_file.parent.mkdir(parents=True, exist_ok=True)
-        self.token_file.write_text(json.dumps({
-            "access_token": token,
-            "saved_at": int(time.time())
-        }), encoding="utf-8")
-        os.chmod(self.token_file, 0o600)
+        # Write beside the target and rename over it so a crash never leaves
+        # a truncated token file behind. Created 0600 in the open call itself,
+        # so the token is never readable under a looser umask.
+        tmp = self.token_file.with_suffix(self.token_file.suffix + ".tmp")
+        fd = os.open(tmp, _TOKEN_OPEN_FLAGS, 0o600)
+        try:
+            os.write(fd, _json_dumps({
+                "access_token": token,
+                "saved_at": int(time.time())
+            }))
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.token_file)
 
     def _load_token(self) -> None:
         if not self.token_file.exists():
             return
         try:
-            data = json.loads(self.token_file.read_text())
+            data = _json_loads(self.token_file.read_bytes())
             self.access_token = data.get("access_token", "")
         except Exception:
             pass
 
     @staticmethod
     def _extract_auth_code(value: str) -> str:
+        value = value.strip()
         if value.startswith("http"):
-            parsed = urlparse(value)
-            query = parse_qs(parsed.query)
             # FYERS callback URLs can include both `code` (status code) and
             # `auth_code` (actual authorization code). Prefer auth_code when
             # available to avoid exchanging an HTTP status value like "200".
-            return query.get("auth_code", [""])[0] or query.get("code", [""])[0]
-        return value.strip()
+            match = _AUTH_CODE_RE.search(value) or _CODE_RE.search(value)
+            return unquote_plus(match.group(1)) if match else ""
+        return value
 
+    # A single float attribute load/store is atomic under the GIL, so the
+    # cooldown timestamp needs no lock of its own.
     def _can_attempt_authentication(self) -> bool:
-        with self._auth_fail_lock:
-            return (time.time() - self._last_auth_failure_ts) >= self._auth_failure_cooldown_seconds
+        return (time.time() - self._last_auth_failure_ts) >= self._auth_failure_cooldown_seconds
 
     def _mark_auth_failure(self) -> None:
-        with self._auth_fail_lock:
-            self._last_auth_failure_ts = time.time()
+        self._last_auth_failure_ts = time.time()
 
 
     @staticmethod
@@ -425,7 +908,7 @@ class FyersAdapter:
         last_error: Optional[Exception] = None
         for endpoint in endpoints:
             try:
-                resp = self.session.post(endpoint, json=payload, timeout=15)
+                resp = self.session.post(endpoint, json=payload, headers=self._NO_AUTH, timeout=15)
                 resp.raise_for_status()
                 data = resp.json()
                 request_key = data.get("request_key")
@@ -443,7 +926,7 @@ class FyersAdapter:
         for attempt in range(3):
             totp = self._generate_totp(self.fyers_totp_secret)
             payload = {"request_key": request_key, "otp": totp}
-            resp = self.session.post(f"{self._auto_auth_base_vagator}/verify_otp", json=payload, timeout=15)
+            resp = self.session.post(f"{self._auto_auth_base_vagator}/verify_otp", json=payload, headers=self._NO_AUTH, timeout=15)
 
             # API may return non-200 for invalid/expired OTP; retry quickly.
             if resp.status_code >= 400:
@@ -475,7 +958,7 @@ class FyersAdapter:
         last_error: Optional[Exception] = None
         for endpoint in endpoints:
             try:
-                resp = self.session.post(endpoint, json=payload, timeout=15)
+                resp = self.session.post(endpoint, json=payload, headers=self._NO_AUTH, timeout=15)
                 resp.raise_for_status()
                 data = resp.json()
                 access_token = data.get("data", {}).get("access_token")
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import datetime
+import atexit
 import logging
 import os
+import queue
 import sys
 import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Deque, List
 
 from dotenv import load_dotenv
 
 from data_provider import DataProvider
 from engine.risk import RiskManager
-from execution.fyers_adapter import FyersAdapter
+from execution.fyers_adapter import FyersAdapter, TokenExpiredError
 from strategies.supertrend import SupertrendStrategy
 
 
@@ -20,27 +24,58 @@ TIMEFRAME = os.getenv("TRADING_TIMEFRAME", "5")
 MAX_TRADES_PER_DAY = int(os.getenv("MAX_TRADES_PER_DAY", "5"))
 DAILY_MAX_LOSS_PERCENT = float(os.getenv("DAILY_MAX_LOSS_PERCENT", "2"))
 LIVE_MODE = os.getenv("LIVE_MODE", "false").strip().lower() == "true"
-MARKET_START = datetime.time(9, 15)
-MARKET_END = datetime.time(15, 30)
+# Market hours as seconds since local midnight: plain int compares per poll.
+MARKET_START = 9 * 3600 + 15 * 60
+MARKET_END = 15 * 3600 + 30 * 60
 POLL_SECONDS = int(os.getenv("MAIN_LOOP_POLL_SECONDS", "5"))
+HISTORY_BARS = 200
+# Cap on the wait after a data call is rejected while the token still validates.
+AUTH_BACKOFF_MAX_SECONDS = 300
+STOP_LOSS_POINTS = 50
 
 
 def setup_logging() -> logging.Logger:
     Path("logs").mkdir(parents=True, exist_ok=True)
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler("logs/trading.log")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    # The loop only enqueues records; file and console writes happen on the
+    # listener thread, which drains the queue on interpreter exit.
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    # Only merge args into the message here; the listener's handlers add the
+    # timestamp/level layout.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler("logs/trading.log"),
-            logging.StreamHandler(sys.stdout),
-        ],
+        handlers=[queue_handler],
     )
     return logging.getLogger("main_bot")
 
 
 def is_market_time() -> bool:
-    now = datetime.datetime.now().time()
-    return MARKET_START <= now <= MARKET_END
+    now = time.localtime()
+    return MARKET_START <= now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec <= MARKET_END
+
+
+def merge_candles(candles: Deque[List[float]], new_bars: List[List[float]]) -> None:
+    """
+    Append delta bars by timestamp: a bar matching the last one replaces it
+    (the forming candle moved), older bars are dropped, newer ones appended.
+    """
+    for bar in new_bars:
+        if candles and bar[0] == candles[-1][0]:
+            candles[-1] = bar
+        elif not candles or bar[0] > candles[-1][0]:
+            candles.append(bar)
 
 
 def main() -> None:
@@ -68,11 +103,14 @@ def main() -> None:
     )
     data_provider = DataProvider(fyers)
     strategy = SupertrendStrategy()
+    # Bootstrapped once, then only the delta since the last bar is fetched.
+    candles: Deque[List[float]] = deque(maxlen=HISTORY_BARS)
 
     current_position = None
     entry_price = None
     quantity = 0
     trades_today = 0
+    auth_rejections = 0
 
     logger.info("Monitoring %s on %sm timeframe", SYMBOL, TIMEFRAME)
 
@@ -92,16 +130,43 @@ def main() -> None:
                 break
 
             try:
-                candles = data_provider.get_latest_data(SYMBOL, TIMEFRAME)
+                if candles:
+                    merge_candles(
+                        candles,
+                        data_provider.fetch_since(SYMBOL, TIMEFRAME, last_ts=candles[-1][0]),
+                    )
+                else:
+                    candles.extend(data_provider.fetch_history(SYMBOL, TIMEFRAME, bars=HISTORY_BARS))
                 latest_close = candles[-1][4]
                 signal = strategy.generate_signal(candles)
+                auth_rejections = 0
+            except TokenExpiredError as exc:
+                logger.warning("FYERS token rejected (%s). Re-authenticating...", exc)
+                token_before = fyers.access_token
+                if not fyers.ensure_authenticated(interactive=not fyers.enable_auto_auth):
+                    logger.error("Re-authentication failed. Stopping loop.")
+                    break
+                if fyers.access_token == token_before:
+                    # /profile still accepts the token (e.g. a 403 for a missing
+                    # data permission), so re-auth cannot fix it: back off.
+                    auth_rejections += 1
+                    logger.error(
+                        "Token still valid but data request rejected (%d in a row). Backing off.",
+                        auth_rejections,
+                    )
+                else:
+                    auth_rejections = 0
+                time.sleep(min(POLL_SECONDS * 2 ** auth_rejections, AUTH_BACKOFF_MAX_SECONDS))
+                continue
             except Exception as exc:
                 logger.error("Data/strategy error: %s", exc)
                 time.sleep(POLL_SECONDS)
                 continue
 
             if current_position is None and signal:
-                stop_loss = latest_close - 50 if signal == "BUY" else latest_close + 50
+                stop_loss = (
+                    latest_close - STOP_LOSS_POINTS if signal == "BUY" else latest_close + STOP_LOSS_POINTS
+                )
                 quantity = risk_manager.calculate_position_size(latest_close, stop_loss)
 
                 if quantity > 0:
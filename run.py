@@ -23,6 +23,7 @@ def main() -> None:
     port = int(os.getenv("APP_PORT", "8000"))
 
     print(f"\n✅ Fyers authentication is valid. Starting server at http://{host}:{port}\n")
+    # One worker only: the app owns the single in-process TradingEngine.
     uvicorn.run("api.main:app", host=host, port=port, reload=False)
 
 
@@ -1,52 +1,90 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional, Sequence, Tuple
 
-
-def _atr(candles: List[List[float]], period: int) -> List[float]:
-    trs = []
-    for i, c in enumerate(candles):
-        high, low, close = c[2], c[3], c[4]
-        prev_close = candles[i - 1][4] if i > 0 else close
-        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        trs.append(tr)
-
-    atr = []
-    for i in range(len(trs)):
-        window = trs[max(0, i - period + 1): i + 1]
-        atr.append(sum(window) / len(window))
-    return atr
+_SIGNALS = (None, "BUY", "SELL")
 
 
 class SupertrendStrategy:
     def __init__(self, period: int = 10, multiplier: float = 3.0):
         self.period = period
         self.multiplier = multiplier
+        # Incremental state over closed bars (all but the last, still-forming
+        # candle): their last `period` true ranges, the close of the newest
+        # one and that whole bar to find where the next call's series resumes.
+        self._trs: Deque[float] = deque(maxlen=period)
+        self._last_close: Optional[float] = None
+        self._last_bar: Optional[Tuple[float, ...]] = None
 
-    def generate_signal(self, candles: List[List[float]]) -> Optional[str]:
-        if len(candles) < self.period + 2:
+    def generate_signal(self, candles: Sequence[Sequence[float]]) -> Optional[str]:
+        period = self.period
+        mult = self.multiplier
+        if len(candles) < period + 2:
             return None
 
-        atr_vals = _atr(candles, self.period)
-        i = len(candles) - 1
-        prev_i = i - 1
+        self._sync(candles)
+        bar, prev_bar = candles[-1], candles[-2]
+        high, low, close = bar[2], bar[3], bar[4]
+        ph, pl, pclose = prev_bar[2], prev_bar[3], prev_bar[4]
+
+        # SMA ATR over `period` true ranges: the previous bar's window is the
+        # closed TRs, the current one swaps the oldest for the forming bar's TR.
+        trs = self._trs
+        tr = max(high - low, abs(high - pclose), abs(low - pclose))
+        prev_atr = sum(trs) / period
+        atr = (sum(islice(trs, 1, None)) + tr) / period
+
+        # One band offset per bar, shared by its upper and lower band.
+        hl2 = (high + low) * 0.5
+        phl2 = (ph + pl) * 0.5
+        band = mult * atr
+        prev_band = mult * prev_atr
+
+        upper = hl2 + band
+        lower = hl2 - band
+        prev_upper = phl2 + prev_band
+        prev_lower = phl2 - prev_band
 
-        high, low, close = candles[i][2], candles[i][3], candles[i][4]
-        ph, pl, pclose = candles[prev_i][2], candles[prev_i][3], candles[prev_i][4]
+        # Both crossings cannot hold at once (upper >= lower), so buy - sell is
+        # 1, -1 or 0 and indexes "BUY", "SELL" or None without branching.
+        buy = (pclose <= prev_upper) & (close > upper)
+        sell = (pclose >= prev_lower) & (close < lower)
+        return _SIGNALS[buy - sell]
 
-        hl2 = (high + low) / 2
-        phl2 = (ph + pl) / 2
+    def _sync(self, candles: Sequence[Sequence[float]]) -> None:
+        """Fold closed bars not seen yet into the TR window.
 
-        upper = hl2 + self.multiplier * atr_vals[i]
-        lower = hl2 - self.multiplier * atr_vals[i]
-        prev_upper = phl2 + self.multiplier * atr_vals[prev_i]
-        prev_lower = phl2 - self.multiplier * atr_vals[prev_i]
+        Only index access is used so a deque of candles works as well as a
+        list. The series continues only if it still holds the last closed
+        bar seen, matched on every field and not just the timestamp: another
+        symbol or a revised history shares the bar grid. Otherwise (new
+        symbol, revision, gap, restart) the window is rebuilt from scratch.
+        """
+        closed = len(candles) - 1
+        start = 0
+        last_bar = self._last_bar
+        if last_bar is not None:
+            last_ts = last_bar[0]
+            j = closed - 1
+            while j >= 0 and candles[j][0] > last_ts:
+                j -= 1
+            if j >= 0 and tuple(candles[j]) == last_bar:
+                start = j + 1
+        if start == 0:
+            self._trs.clear()
+            self._last_close = candles[0][4]
 
-        if pclose <= prev_upper and close > upper:
-            return "BUY"
-        if pclose >= prev_lower and close < lower:
-            return "SELL"
-        return None
+        trs = self._trs
+        prev_close = self._last_close
+        for k in range(start, closed):
+            c = candles[k]
+            high, low = c[2], c[3]
+            trs.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+            prev_close = c[4]
+        self._last_close = prev_close
+        self._last_bar = tuple(candles[closed - 1])
 
     def build_trade_signal(self, symbol: str, side: str, ltp: float, qty: int) -> Dict:
         sl_offset = 50.0
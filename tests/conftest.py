@@ -0,0 +1,72 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from execution.fyers_adapter import FyersAdapter
+
+
+# Built once at import; every stub response of a given status raises the
+# same HTTPError instead of allocating a new one (and a mock) per call.
+_HTTP_ERRORS = {
+    code: requests.HTTPError(response=SimpleNamespace(status_code=code))
+    for code in (400, 401, 403, 429, 503)
+}
+
+
+def _raise_http(status):
+    error = _HTTP_ERRORS[status]
+
+    def _raise():
+        # Drop the previous raise's traceback so reuse never chains frames.
+        raise error.with_traceback(None)
+    return _raise
+
+
+def _mk_resp(status, payload=None):
+    """Just the Response surface the adapter touches; far cheaper than MagicMock."""
+    body = json.dumps(payload or {}).encode()
+    return SimpleNamespace(
+        status_code=status,
+        headers={},
+        content=body,
+        json=lambda: payload or {},
+        raise_for_status=(lambda: None) if status < 400 else _raise_http(status),
+        close=lambda: None,
+    )
+
+
+@pytest.fixture(scope="module")
+def fyers_env(tmp_path_factory):
+    """FYERS_* settings shared by every adapter test in a module."""
+    token_file = tmp_path_factory.mktemp("fyers") / "token.json"
+    return {
+        "FYERS_CLIENT_ID": "ABCD1234-100",
+        "FYERS_SECRET_KEY": "secret",
+        "FYERS_REDIRECT_URI": "http://127.0.0.1",
+        "FYERS_BASE_URL": "https://api-t1.fyers.in",
+        "FYERS_TOKEN_FILE": str(token_file),
+    }
+
+
+@pytest.fixture
+def adapter(fyers_env, monkeypatch):
+    for key, value in fyers_env.items():
+        monkeypatch.setenv(key, value)
+    return FyersAdapter()
+
+
+@pytest.fixture(scope="module")
+def shared_adapter(fyers_env):
+    """One adapter for tests that only patch its session per test."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in fyers_env.items():
+            mp.setenv(key, value)
+        yield FyersAdapter()
+
+
+@pytest.fixture
+def mk_resp():
+    """Factory for stub responses, shared by the Fyers test modules."""
+    return _mk_resp
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+import data_provider
+from data_provider import DataProvider
+
+NOW = 1_700_000_200  # 100 s past a 5-minute bar boundary
+
+
+def _bar(ts):
+    return [ts, 1.0, 1.0, 1.0, 1.0, 100]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": float(NOW)}
+    monkeypatch.setattr(data_provider, "time", SimpleNamespace(time=lambda: now["t"]))
+    return now
+
+
+@pytest.fixture
+def fyers():
+    return SimpleNamespace(get_history=Mock(return_value=[]))
+
+
+def test_fetch_history_trims_to_bars(fyers, clock):
+    fyers.get_history.return_value = [_bar(300 * i) for i in range(10)]
+    candles = DataProvider(fyers).fetch_history("NSE:SBIN-EQ", "5", bars=4)
+    assert [bar[0] for bar in candles] == [1800, 2100, 2400, 2700]
+
+
+def test_fetch_history_raises_without_data(fyers, clock):
+    with pytest.raises(ValueError, match="No data received"):
+        DataProvider(fyers).fetch_history("NSE:SBIN-EQ", "5")
+
+
+def test_fetch_since_asks_from_last_bar_to_now(fyers, clock):
+    fyers.get_history.return_value = [_bar(NOW - 100)]
+    provider = DataProvider(fyers)
+    assert provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100.0) == [_bar(NOW - 100)]
+    fyers.get_history.assert_called_once_with(
+        symbol="NSE:SBIN-EQ",
+        resolution="5",
+        range_from=str(NOW - 100),
+        range_to=str(NOW),
+    )
+
+
+def test_empty_delta_not_refetched_before_bar_boundary(fyers, clock):
+    provider = DataProvider(fyers)
+    assert provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100) == []
+    clock["t"] = NOW + 150  # still inside the same 5-minute bar
+    assert provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100) == []
+    assert fyers.get_history.call_count == 1
+
+    clock["t"] = NOW + 200  # next bar boundary
+    provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100)
+    assert fyers.get_history.call_count == 2
+
+
+def test_non_empty_delta_clears_the_memo(fyers, clock):
+    provider = DataProvider(fyers)
+    provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100)
+    clock["t"] = NOW + 200
+    fyers.get_history.return_value = [_bar(NOW + 200)]
+    provider.fetch_since("NSE:SBIN-EQ", "5", last_ts=NOW - 100)
+    assert ("NSE:SBIN-EQ", "5") not in provider._empty_result_until
+
+
+@pytest.mark.parametrize("timeframe", ["D", "1D", "W"])
+def test_non_numeric_timeframe_never_memoised(fyers, clock, timeframe):
+    provider = DataProvider(fyers)
+    provider.fetch_since("NSE:SBIN-EQ", timeframe, last_ts=NOW - 100)
+    provider.fetch_since("NSE:SBIN-EQ", timeframe, last_ts=NOW - 100)
+    assert fyers.get_history.call_count == 2
+    assert not provider._empty_result_until
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import pytest
+
+from engine.mode import ModeManager, TradingMode
+from engine.portfolio import Portfolio
+from engine.risk import RiskManager
+
+# Inside market hours and before the 14:45 cut-off, whatever the wall clock says.
+FIXED_NOW = datetime(2024, 1, 1, 9, 30)
+
+
+@pytest.mark.parametrize(
+    "capital,entry,stop,expected",
+    [
+        (100000, 22000, 21950, 20),
+        (100000, 21950, 22000, 20),
+        # 1000 / (100.0 - 99.6) is 2499.99... in floating point.
+        (100000, 100.0, 99.6, 2500),
+        (100000, 100.0, 100.0, 0),
+    ],
+)
+def test_position_size(capital, entry, stop, expected):
+    assert RiskManager(capital).calculate_position_size(entry, stop) == expected
+
+
+@pytest.mark.parametrize(
+    "limits,pnls,now,blocked,reason",
+    [
+        ({"max_trades_per_day": 1}, [], FIXED_NOW, False, ""),
+        ({"max_trades_per_day": 1}, [-100], FIXED_NOW, True, "Max trades/day reached"),
+        ({"max_trades_per_day": 5, "max_losses_per_day": 2}, [-100, -100], FIXED_NOW, True, "Stopped after 2 losses"),
+        ({"max_trades_per_day": 5, "max_losses_per_day": 2}, [-100, 250], FIXED_NOW, False, ""),
+        ({}, [], FIXED_NOW.replace(hour=14, minute=50), True, "No new trade after 2:45 PM"),
+    ],
+)
+def test_trade_limits(limits, pnls, now, blocked, reason):
+    risk = RiskManager(100000, **limits)
+    for pnl in pnls:
+        risk.register_trade(pnl)
+    snap = risk.can_open_new_trade(now)
+    assert snap.blocked == blocked
+    assert snap.reason == reason
+
+
+@pytest.mark.parametrize(
+    "side,exit_price,expected",
+    [("BUY", 22100, 1000), ("SELL", 21900, 1000), ("SELL", 22100, -1000)],
+)
+def test_add_and_close_position(side, exit_price, expected):
+    pf = Portfolio()
+    pf.open_trade('NIFTY', side, 10, 22000, 21950, 22100, 'PAPER')
+    assert pf.close_trade(exit_price, 'Target hit') == expected
+    assert not pf.has_open_position()
+
+
+def test_live_requires_confirmation():
+    mm = ModeManager(TradingMode.PAPER)
+    with pytest.raises(ValueError):
+        mm.switch_mode(TradingMode.LIVE, has_open_position=False, confirm_live=False, auth_validator=lambda: True)
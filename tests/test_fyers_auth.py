@@ -0,0 +1,28 @@
+def test_auto_auth_path(adapter, monkeypatch):
+    called = {"auto": False}
+
+    def _auto():
+        called["auto"] = True
+        return True
+
+    monkeypatch.setattr(adapter, "enable_auto_auth", True)
+    monkeypatch.setattr(adapter, "validate_token", lambda force=False: False)
+    monkeypatch.setattr(adapter, "authenticate_auto", _auto)
+
+    assert adapter.ensure_authenticated(interactive=False)
+    assert called["auto"]
+
+
+def test_interactive_auth_path(adapter, monkeypatch):
+    called = {"interactive": False}
+
+    def _interactive():
+        called["interactive"] = True
+        return True
+
+    monkeypatch.setattr(adapter, "enable_auto_auth", False)
+    monkeypatch.setattr(adapter, "validate_token", lambda force=False: False)
+    monkeypatch.setattr(adapter, "authenticate_interactive", _interactive)
+
+    assert adapter.ensure_authenticated(interactive=True)
+    assert called["interactive"]
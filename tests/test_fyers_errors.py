@@ -0,0 +1,33 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from execution.fyers_adapter import FyersAdapter, TokenExpiredError
+
+
+@pytest.mark.parametrize(
+    "missing", ["FYERS_CLIENT_ID", "FYERS_SECRET_KEY", "FYERS_REDIRECT_URI", "FYERS_BASE_URL"]
+)
+def test_missing_env_fails_fast(fyers_env, monkeypatch, missing):
+    for key, value in fyers_env.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv(missing)
+
+    with pytest.raises(RuntimeError, match=f"{missing} not set"):
+        FyersAdapter()
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_rejected_token_on_data_path_invalidates_validation(adapter, mk_resp, status):
+    adapter.access_token = "tok"
+    adapter._token_validation = (time.monotonic(), True)
+
+    with patch.object(adapter.session, "request", return_value=mk_resp(status)) as req:
+        with pytest.raises(TokenExpiredError):
+            adapter.get_history("NSE:SBIN-EQ")
+        # The cached "valid" result is dropped, so the next check probes /profile.
+        assert not adapter.validate_token()
+
+    assert req.call_count == 2
+    assert req.call_args.args[1].endswith("/api/v3/profile")
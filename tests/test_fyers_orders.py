@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+ORDER = {
+    "symbol": "NSE:SBIN-EQ",
+    "qty": 1,
+    "type": 2,
+    "side": 1,
+    "productType": "INTRADAY",
+    "validity": "DAY",
+}
+
+
+def test_duplicate_order_blocked_within_ttl(adapter, mk_resp):
+    with patch.object(adapter.session, "request", return_value=mk_resp(200, {"s": "ok"})) as req:
+        assert adapter.place_order(dict(ORDER)) == {"s": "ok"}
+        with pytest.raises(ValueError, match="Duplicate order blocked"):
+            adapter.place_order(dict(ORDER))
+        # A different side is a different order.
+        adapter.place_order({**ORDER, "side": -1})
+
+    assert req.call_count == 2
+
+
+def test_duplicate_order_allowed_after_ttl(adapter, mk_resp, monkeypatch):
+    monkeypatch.setattr(adapter, "_order_dedupe_ttl", 0.0)
+    with patch.object(adapter.session, "request", return_value=mk_resp(200, {"s": "ok"})) as req:
+        adapter.place_order(dict(ORDER))
+        adapter.place_order(dict(ORDER))
+
+    assert req.call_count == 2
+    assert len(adapter._order_dedupe) == 1
+
+
+def test_failed_order_releases_its_key(adapter, mk_resp):
+    responses = [mk_resp(400), mk_resp(200, {"s": "ok"})]
+    with patch.object(adapter.session, "request", side_effect=responses) as req:
+        with pytest.raises(requests.HTTPError):
+            adapter.place_order(dict(ORDER))
+        assert adapter.place_order(dict(ORDER)) == {"s": "ok"}
+
+    assert req.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "field,value,error",
+    [
+        ("symbol", "  ", "symbol"),
+        ("qty", 0, "qty"),
+        ("qty", 1.5, "qty"),
+        ("qty", True, "qty"),
+        ("productType", "CNC", "productType"),
+        ("side", 0, "side"),
+        ("side", "BUY", "side"),
+        ("side", True, "side"),
+        ("type", 5, "type"),
+        ("type", True, "type"),
+    ],
+)
+def test_invalid_order_rejected_before_request(adapter, field, value, error):
+    with patch.object(adapter.session, "request") as req:
+        with pytest.raises(ValueError, match=error):
+            adapter.place_order({**ORDER, field: value})
+
+    req.assert_not_called()
+    assert not adapter._order_dedupe
@@ -0,0 +1,57 @@
+import threading
+from unittest.mock import patch
+
+ORDER = {
+    "symbol": "NSE:SBIN-EQ",
+    "qty": 1,
+    "type": 2,
+    "side": 1,
+    "productType": "INTRADAY",
+    "validity": "DAY",
+}
+POSITION = {"symbol": "NSE:SBIN-EQ", "netQty": 1}
+
+
+def test_positions_fetched_before_an_order_are_not_reused(adapter, mk_resp):
+    before = mk_resp(200, {"netPositions": []})
+    after = mk_resp(200, {"netPositions": [POSITION]})
+    positions = iter([before, after])
+    in_flight, release = threading.Event(), threading.Event()
+
+    def _request(method, url, **kwargs):
+        if method == "POST":
+            return mk_resp(200, {"s": "ok"})
+        resp = next(positions)
+        if resp is before:
+            # Hold the pre-order fetch open until the order has gone in.
+            in_flight.set()
+            release.wait(5)
+        return resp
+
+    results = {}
+    with patch.object(adapter.session, "request", side_effect=_request) as req:
+        stale = threading.Thread(target=lambda: results.setdefault("stale", adapter.get_positions()))
+        stale.start()
+        assert in_flight.wait(5)
+        adapter.place_order(dict(ORDER))
+        # Must not join the pre-order fetch still in flight.
+        fresh = adapter.get_positions()
+        release.set()
+        stale.join(5)
+        cached = adapter.get_positions()
+
+    assert results["stale"] == []
+    # The late pre-order answer never overwrote the fresh cache entry.
+    assert fresh == cached == [POSITION]
+    assert req.call_count == 3
+
+
+def test_cached_positions_are_copies(adapter, mk_resp, monkeypatch):
+    monkeypatch.setattr(adapter, "_positions_cache_ttl", 60.0)
+    resp = mk_resp(200, {"netPositions": [dict(POSITION)]})
+    with patch.object(adapter.session, "request", return_value=resp) as req:
+        adapter.get_positions()[0]["netQty"] = 99
+        adapter.get_positions()[0]["netQty"] = 98
+        assert adapter.get_positions() == [POSITION]
+
+    assert req.call_count == 1
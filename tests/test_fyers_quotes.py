@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+
+SYMBOLS = [f"NSE:SYM{i}-EQ" for i in range(120)]
+
+
+def _quotes(*entries):
+    return {"s": "ok", "d": list(entries)}
+
+
+def _echo_quotes(mk_resp):
+    """Answer each /data/quotes call with an LTP for every symbol it asked for."""
+    def _request(method, url, params=None, **kwargs):
+        symbols = params["symbols"].split(",")
+        return mk_resp(200, _quotes(*({"n": s, "v": {"lp": 1.0}} for s in symbols)))
+    return _request
+
+
+def _batch_sizes(req):
+    return sorted(len(call.kwargs["params"]["symbols"].split(",")) for call in req.call_args_list)
+
+
+def test_ltps_matched_by_symbol_name(adapter, mk_resp):
+    resp = mk_resp(200, _quotes(
+        {"n": "NSE:TCS-EQ", "v": {"lp": 3500.5}},
+        {"n": "NSE:SBIN-EQ", "v": {"lp": 610.25}},
+    ))
+    with patch.object(adapter.session, "request", return_value=resp):
+        assert adapter.get_ltps(["NSE:SBIN-EQ", "NSE:TCS-EQ"]) == {
+            "NSE:SBIN-EQ": 610.25,
+            "NSE:TCS-EQ": 3500.5,
+        }
+
+
+def test_single_symbol_fallback_without_name(adapter, mk_resp):
+    resp = mk_resp(200, _quotes({"v": {"lp": 610.25}}))
+    with patch.object(adapter.session, "request", return_value=resp):
+        assert adapter.get_ltp("NSE:SBIN-EQ") == 610.25
+
+
+def test_missing_lp_raises(adapter, mk_resp):
+    resp = mk_resp(200, _quotes({"n": "NSE:SBIN-EQ", "v": {}}))
+    with patch.object(adapter.session, "request", return_value=resp):
+        with pytest.raises(RuntimeError, match="No LTP returned for NSE:SBIN-EQ"):
+            adapter.get_ltp("NSE:SBIN-EQ")
+
+
+def test_ltp_served_from_cache_within_ttl(adapter, mk_resp, monkeypatch):
+    monkeypatch.setattr(adapter, "_ltp_cache_ttl", 60.0)
+    resp = mk_resp(200, _quotes({"n": "NSE:SBIN-EQ", "v": {"lp": 610.25}}))
+    with patch.object(adapter.session, "request", return_value=resp) as req:
+        assert adapter.get_ltp("NSE:SBIN-EQ") == 610.25
+        assert adapter.get_ltp("NSE:SBIN-EQ") == 610.25
+
+    assert req.call_count == 1
+
+
+def test_ltps_batched_and_fanned_out(adapter, mk_resp):
+    with patch.object(adapter.session, "request", side_effect=_echo_quotes(mk_resp)) as req:
+        ltps = adapter.get_ltps(SYMBOLS)
+
+    assert ltps == dict.fromkeys(SYMBOLS, 1.0)
+    assert _batch_sizes(req) == [20, 50, 50]
+    assert all(call.args[1].endswith("/data/quotes") for call in req.call_args_list)
+    # More than one batch goes through the fan-out pool.
+    assert adapter._executor is not None
+    adapter.close()
+
+
+def test_ltps_async_batched(adapter, mk_resp):
+    with patch.object(adapter.session, "request", side_effect=_echo_quotes(mk_resp)) as req:
+        ltps = asyncio.run(adapter.get_ltps_async(SYMBOLS))
+
+    assert ltps == dict.fromkeys(SYMBOLS, 1.0)
+    assert _batch_sizes(req) == [20, 50, 50]
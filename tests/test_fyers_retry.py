@@ -0,0 +1,55 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from execution.fyers_adapter import FyersAdapter
+
+
+def test_retry_only_on_429_and_503(shared_adapter, mk_resp):
+    responses = [mk_resp(429), mk_resp(200), mk_resp(503), mk_resp(200), mk_resp(401)]
+    with patch("execution.fyers_adapter.time.sleep") as slp, \
+            patch.object(shared_adapter._rng, "uniform", return_value=0.0), \
+            patch.object(shared_adapter.session, "request", side_effect=responses) as req:
+        assert shared_adapter._request_with_backoff("GET", "/api/v3/positions").status_code == 200
+        assert shared_adapter._request_with_backoff("GET", "/api/v3/positions").status_code == 200
+        with pytest.raises(requests.HTTPError):
+            shared_adapter._request_with_backoff("GET", "/api/v3/positions")
+
+    # 429 and 503 each retried once, 401 not retried at all.
+    assert req.call_count == 5
+    assert [c.args for c in slp.call_args_list] == [(0.0,), (0.0,)]
+
+
+def test_unreturned_responses_are_closed(shared_adapter, mk_resp):
+    responses = [mk_resp(429), mk_resp(200), mk_resp(401)]
+    for resp in responses:
+        resp.close = Mock()
+    with patch("execution.fyers_adapter.time.sleep"), \
+            patch.object(shared_adapter.session, "request", side_effect=responses):
+        shared_adapter._request_with_backoff("GET", "/api/v3/positions", stream=True)
+        with pytest.raises(requests.HTTPError):
+            shared_adapter._request_with_backoff("GET", "/api/v3/positions", stream=True)
+
+    # The retried and the raised responses give their connections back; the
+    # returned one is left for the caller to read and close.
+    assert [resp.close.called for resp in responses] == [True, False, True]
+
+
+def test_circuit_opens_after_consecutive_5xx(adapter, monkeypatch, mk_resp):
+    monkeypatch.setattr(adapter, "_max_retries", 1)
+    monkeypatch.setattr(adapter, "_circuit_threshold", 2)
+    monkeypatch.setattr("execution.fyers_adapter.time.sleep", lambda _: None)
+    with patch.object(adapter.session, "request", return_value=mk_resp(503)) as req:
+        with pytest.raises(requests.HTTPError):
+            adapter._request_with_backoff("GET", "/data/quotes")
+        with pytest.raises(RuntimeError):
+            adapter._request_with_backoff("GET", "/data/quotes")
+    assert req.call_count == 2
+
+
+def test_parse_retry_after():
+    assert FyersAdapter._parse_retry_after("3") == 3.0
+    assert FyersAdapter._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert FyersAdapter._parse_retry_after("soon") is None
+    assert FyersAdapter._parse_retry_after(None) is None
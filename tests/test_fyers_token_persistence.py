@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from execution.fyers_adapter import FyersAdapter
+
+
+def test_exchange_token_uses_base_url_and_persists_token(shared_adapter, fyers_env, mk_resp):
+    responses = [mk_resp(200, {"s": "ok", "access_token": "tok-123"}), mk_resp(200)]
+    with patch.object(shared_adapter.session, "request", side_effect=responses) as req:
+        data = shared_adapter.exchange_auth_code("auth-xyz")
+
+    assert data["access_token"] == "tok-123"
+    assert shared_adapter.access_token == "tok-123"
+    method, url = req.call_args_list[0].args
+    assert (method, url) == ("POST", "https://api-t1.fyers.in/api/v3/token")
+    assert json.loads(req.call_args_list[0].kwargs["data"])["code"] == "auth-xyz"
+    saved = json.loads(Path(fyers_env["FYERS_TOKEN_FILE"]).read_bytes())
+    assert saved["access_token"] == "tok-123"
+
+
+def test_token_file_corruption_recovery(fyers_env, tmp_path, monkeypatch):
+    token_file = tmp_path / "token.json"
+    token_file.write_bytes(b"{broken")
+    for key, value in fyers_env.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("FYERS_TOKEN_FILE", str(token_file))
+
+    adapter = FyersAdapter()
+    assert adapter.access_token == ""
+
+    adapter._save_token("tok-456")
+    assert FyersAdapter().access_token == "tok-456"
@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    "state,expected",
+    [
+        ("x", "state=x"),
+        ("long-state-abc", "state=long-state-abc"),
+        ("y+", "state=y%2B"),
+        ("y%2B", "state=y%252B"),
+        ("a b/c", "state=a%20b%2Fc"),
+    ],
+)
+def test_login_url_uses_base_url(shared_adapter, state, expected):
+    url = shared_adapter.get_login_url(state=state)
+    assert url.startswith("https://api-t1.fyers.in/api/v3/generate-authcode?")
+    assert "client_id=ABCD1234-100" in url
+    assert url.endswith(expected)
@@ -0,0 +1,32 @@
+from collections import deque
+
+from main import merge_candles
+
+
+def _bar(ts, close):
+    return [ts, close, close, close, close, 100]
+
+
+def test_same_timestamp_replaces_forming_bar():
+    candles = deque([_bar(0, 1.0), _bar(300, 2.0)])
+    merge_candles(candles, [_bar(300, 2.5)])
+    assert list(candles) == [_bar(0, 1.0), _bar(300, 2.5)]
+
+
+def test_older_bars_dropped_and_newer_appended():
+    candles = deque([_bar(0, 1.0), _bar(300, 2.0)])
+    merge_candles(candles, [_bar(0, 9.0), _bar(300, 2.1), _bar(600, 3.0), _bar(900, 4.0)])
+    assert list(candles) == [_bar(0, 1.0), _bar(300, 2.1), _bar(600, 3.0), _bar(900, 4.0)]
+
+
+def test_empty_deque_takes_every_bar():
+    candles = deque()
+    merge_candles(candles, [_bar(0, 1.0), _bar(300, 2.0)])
+    assert [bar[0] for bar in candles] == [0, 300]
+
+
+def test_deque_keeps_its_maxlen():
+    candles = deque((_bar(300 * i, float(i)) for i in range(3)), maxlen=3)
+    merge_candles(candles, [_bar(600, 2.5), _bar(900, 3.0), _bar(1200, 4.0)])
+    assert [bar[0] for bar in candles] == [600, 900, 1200]
+    assert candles[0][4] == 2.5
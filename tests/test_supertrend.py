@@ -0,0 +1,89 @@
+import random
+from collections import deque
+
+from strategies.supertrend import SupertrendStrategy
+
+
+def _candles(n, seed=7, spike_at=36):
+    rng = random.Random(seed)
+    candles, price = [], 22000.0
+    for i in range(n):
+        high = price + rng.uniform(0, 40)
+        low = price - rng.uniform(0, 40)
+        close = rng.uniform(low, high)
+        if i % 37 == spike_at:
+            # Occasional wide-range bar closing at an extreme, so the
+            # bands are actually crossed in both directions.
+            high, low = price + 1500, price - 1500
+            close = high if (i // 37) % 2 else low
+        candles.append([1700000000 + 300 * i, price, high, low, close, 1000])
+        price = close
+    return candles
+
+
+def _reference_atr(candles, period):
+    """Straightforward SMA ATR, recomputed over the whole series each call."""
+    trs = []
+    for i, (_, _, high, low, close, _) in enumerate(candles):
+        prev_close = candles[i - 1][4] if i > 0 else close
+        trs.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+    return [
+        sum(trs[max(0, i - period + 1):i + 1]) / min(i + 1, period)
+        for i in range(len(trs))
+    ]
+
+
+def _full_recompute(candles, period=10, multiplier=3.0):
+    if len(candles) < period + 2:
+        return None
+    atr = _reference_atr(candles, period)
+    (_, _, h, l, c, _), (_, _, ph, pl, pc, _) = candles[-1], candles[-2]
+    if pc <= (ph + pl) / 2 + multiplier * atr[-2] and c > (h + l) / 2 + multiplier * atr[-1]:
+        return "BUY"
+    if pc >= (ph + pl) / 2 - multiplier * atr[-2] and c < (h + l) / 2 - multiplier * atr[-1]:
+        return "SELL"
+    return None
+
+
+def test_incremental_matches_full_recompute():
+    candles = _candles(300)
+    growing, window = SupertrendStrategy(), SupertrendStrategy()
+    signals = []
+    for i in range(1, len(candles) + 1):
+        expected = _full_recompute(candles[:i])
+        assert growing.generate_signal(candles[:i]) == expected
+        # Sliding deque window, as a live poller keeps it.
+        chunk = candles[max(0, i - 50):i]
+        assert window.generate_signal(deque(chunk)) == _full_recompute(chunk)
+        signals.append(expected)
+    assert {"BUY", "SELL"} <= set(signals)
+
+
+def test_resets_when_series_does_not_continue():
+    strategy = SupertrendStrategy()
+    first, other = _candles(60, seed=1), _candles(60, seed=2)
+    strategy.generate_signal(first)
+    for i in range(12, 61):
+        assert strategy.generate_signal(other[:i]) == _full_recompute(other[:i])
+
+
+def test_resets_when_another_series_shares_timestamps():
+    # Same bar grid, different prices (another symbol or a revised history).
+    # Reusing the first series' TR window would hide the second's signals.
+    first, other = _candles(120, seed=1, spike_at=30), _candles(120, seed=2)
+    signals = []
+    for i in range(12, 121):
+        strategy = SupertrendStrategy()
+        strategy.generate_signal(first[:i])
+        expected = _full_recompute(other[:i])
+        assert strategy.generate_signal(other[:i]) == expected
+        signals.append(expected)
+    assert {"BUY", "SELL"} <= set(signals)
+
+
+def test_multiplier_change_takes_effect():
+    candles = _candles(120)
+    strategy = SupertrendStrategy()
+    strategy.multiplier = 0.5
+    for i in range(12, 121):
+        assert strategy.generate_signal(candles[:i]) == _full_recompute(candles[:i], multiplier=0.5)